@@ -1,4 +1,7 @@
+import numbers
+import operator
 import unittest
+from collections.abc import Mapping
 
 
 def minmax(lst):
@@ -24,9 +27,59 @@ def all_pairs(x, y):
     return pairs
 
 
-def list_to_dict(lst):
-    """Function to convert a list into a dictionary with keys starting from 1."""
-    return {i + 1: val for i, val in enumerate(lst)}
+class OneBasedView(Mapping):
+    """Read-only mapping view of a list (or any sequence) with keys starting from 1."""
+
+    __slots__ = ("_seq",)
+
+    def __init__(self, seq):
+        self._seq = seq  # Not copied: the view follows later changes to the sequence
+
+    def __getitem__(self, key):
+        index = self._index(key)
+        if index is None:
+            raise KeyError(key)
+        return self._seq[index - 1]
+
+    def __contains__(self, key):
+        return self._index(key) is not None
+
+    def _index(self, key):
+        # Like a dict with int keys: any number equal to an int in range matches, e.g. 1.0
+        try:
+            index = operator.index(key)
+        except TypeError:
+            if not isinstance(key, numbers.Number):
+                return None
+            try:
+                index = int(key)
+            except (TypeError, ValueError, OverflowError):  # complex, nan and inf
+                return None
+            if index != key:
+                return None
+        return index if 1 <= index <= len(self._seq) else None
+
+    def __iter__(self):
+        return iter(range(1, len(self._seq) + 1))
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._seq!r})"
+
+    def materialize(self):
+        """Function to copy the view into a real dictionary."""
+        return {i + 1: val for i, val in enumerate(self._seq)}
+
+
+def list_to_dict(lst, materialize=False):
+    """Function to view a list as a dictionary with keys starting from 1, without copying it.
+
+    Pass materialize=True to get a real dict instead of a read-only view.
+    """
+    view = OneBasedView(lst)
+    return view.materialize() if materialize else view
 
 
 def invert_dict(d):
@@ -128,6 +181,24 @@ class TestFunctions(unittest.TestCase):
         if result != expected:
             print(f"Error: Test list_to_dict([0]) - Expected {expected}, got {result}")
 
+        # Keys equal to an int work as they would in a dict
+        result = list_to_dict([5])
+        if result[1.0] != 5 or 1.0 not in result or 1.5 in result or "1" in result:
+            print("Error: Test list_to_dict([5]) - Expected 1.0 (but not 1.5 or '1') to be a key")
+
+        result = list_to_dict([4, 5], materialize=True)
+        expected = {1: 4, 2: 5}
+        if type(result) is not dict or result != expected:
+            print(f"Error: Test list_to_dict([4, 5], materialize=True) - Expected {expected}, got {result}")
+
+        lst = [2, 6, 6]
+        result = list_to_dict(lst)
+        if result[1] != 2 or result.get(3) != 6 or 0 in result or 4 in result or result.get(4) is not None:
+            print(f"Error: Test list_to_dict({lst}) - Lookups do not match 1-based keys, got {result}")
+        lst.append(8)
+        if len(result) != 4 or result[4] != 8:
+            print(f"Error: Test list_to_dict({lst}) - View did not follow the list, got {result}")
+
     def test_invert_dict(self):
         result = invert_dict({1: 2, 2: 3})
         expected = {2: 1, 3: 2}
@@ -1,3 +1,7 @@
+import math
+from itertools import compress
+
+
 def is_prime(number):
     """
     The function first checks if the number is less than or equal to 1 (not prime),
@@ -39,6 +43,177 @@ def generate_primes(n_max):
     return primes
 
 
+def _numpy():
+    """Return the numpy module, or None if it is not installed (imported lazily)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _prime_pi_python(n):
+    """Lucy_Hedgehog prime counting in pure Python."""
+    r = math.isqrt(n)
+    # small[v] counts the survivors <= v, large[i] the survivors <= n // i.
+    # Before sieving every number >= 2 survives.
+    small = [v - 1 for v in range(r + 1)]
+    large = [0] + [n // i - 1 for i in range(1, r + 1)]
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p was removed, so it is not prime
+        sp = small[p - 1]  # Primes below p
+        p2 = p * p
+        n_p = n // p
+        lim = min(r, n // p2)
+        b = min(lim, r // p)
+        # Remove the survivors whose smallest prime factor is p, largest values first
+        for i in range(1, b + 1):
+            large[i] -= large[i * p] - sp
+        for i in range(b + 1, lim + 1):
+            large[i] -= small[n_p // i] - sp
+        for v in range(r, p2 - 1, -1):
+            small[v] -= small[v // p] - sp
+
+    return large[1]
+
+
+def _prime_pi_numpy(n, np):
+    """The same algorithm as `_prime_pi_python`, one vectorized update per prime."""
+    r = math.isqrt(n)
+    small = np.arange(-1, r, dtype=np.int64)
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = n // np.arange(1, r + 1, dtype=np.int64) - 1
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue
+        sp = small[p - 1]
+        p2 = p * p
+        n_p = n // p
+        lim = min(r, n // p2)
+        b = min(lim, r // p)
+        # Each right-hand side is computed before the update, so every value
+        # read is the one from before this prime, as in the scalar loops
+        large[1:b + 1] -= large[p:b * p + 1:p] - sp
+        if lim > b:
+            large[b + 1:lim + 1] -= small[n_p // np.arange(b + 1, lim + 1, dtype=np.int64)] - sp
+        if r >= p2:
+            small[p2:] -= small[np.arange(p2, r + 1, dtype=np.int64) // p] - sp
+
+    return int(large[1])
+
+
+def prime_pi(n):
+    """
+    Count the prime numbers less than or equal to n.
+
+    Uses the Lucy_Hedgehog method, which runs in about O(n**(3/4)) time and
+    O(n**(1/2)) memory instead of sieving every number up to n. NumPy is
+    used for large n when it is installed; n up to 10**12 then takes seconds.
+
+    Reference: https://en.wikipedia.org/wiki/Prime-counting_function
+
+    Parameters:
+    n (int): The upper bound.
+
+    Returns:
+    int: The number of primes p with p <= n.
+    """
+    if n < 2:
+        return 0
+    if n >= 10**6 and n < 2**62:
+        np = _numpy()
+        if np is not None:
+            return _prime_pi_numpy(n, np)
+    return _prime_pi_python(n)
+
+
+def _li(x):
+    """Logarithmic integral li(x) for x > 1, from the series for Ei(ln x)."""
+    log_x = math.log(x)
+    total = 0.0
+    term = 1.0
+    for k in range(1, 1000):
+        term *= log_x / k
+        total += term / k
+        if term / k < 1e-17 * total:
+            break
+    return 0.5772156649015329 + math.log(log_x) + total  # Euler-Mascheroni constant
+
+
+def _primes_in_range(lo, hi, base_primes):
+    """Primes p with lo <= p <= hi, given every prime up to sqrt(hi)."""
+    lo = max(lo, 2)
+    if hi < lo:
+        return []
+    segment = bytearray([1]) * (hi - lo + 1)
+    for p in base_primes:
+        if p * p > hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p) - lo
+        segment[start::p] = bytes(len(range(start, len(segment), p)))
+    return list(compress(range(lo, hi + 1), segment))
+
+
+def nth_prime(k):
+    """
+    Return the k-th prime number, counting 2 as the first.
+
+    Estimates the answer with the inverse logarithmic integral, counts the
+    primes up to the estimate with `prime_pi` and sieves only the short
+    stretch between the estimate and the answer.
+
+    Parameters:
+    k (int): The position of the prime, k >= 1.
+
+    Returns:
+    int: The k-th prime.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if k < 6:
+        return (2, 3, 5, 7, 11)[k - 1]
+
+    # Newton's method on li(x) = k, starting from the prime number theorem
+    x = k * math.log(k)
+    for _ in range(100):
+        step = (_li(x) - k) * math.log(x)
+        x -= step
+        if abs(step) < 1:
+            break
+    x = int(x)
+
+    count = prime_pi(x)
+    width = max(1 << 16, 4 * math.isqrt(x))
+    base_limit = math.isqrt(x + 16 * width)
+    base_primes = generate_primes(base_limit)
+
+    if count < k:
+        # Walk upwards from x until the k-th prime is reached
+        lo = x + 1
+        while True:
+            hi = lo + width - 1
+            if math.isqrt(hi) > base_limit:
+                base_limit = math.isqrt(hi + 16 * width)
+                base_primes = generate_primes(base_limit)
+            primes = _primes_in_range(lo, hi, base_primes)
+            if count + len(primes) >= k:
+                return primes[k - count - 1]
+            count += len(primes)
+            lo = hi + 1
+    else:
+        # Walk downwards: there are count primes <= hi and we need the k-th
+        hi = x
+        while True:
+            primes = _primes_in_range(hi - width + 1, hi, base_primes)
+            if count - len(primes) < k:
+                return primes[k - (count - len(primes)) - 1]
+            count -= len(primes)
+            hi -= width
+
+
 def is_anagram(word_one, word_two):
     """
     Checks pairs of words in a list to determine if they are anagrams of each other.
@@ -174,6 +349,22 @@ def test_is_prime():
         assert is_prime(n) == (n in prime_set)
 
 
+def test_prime_pi():
+    for n_max in (0, 1, 2, 10, 100, 1000, 7500):
+        assert prime_pi(n_max) == len(generate_primes(n_max))
+    for n in range(200):
+        assert prime_pi(n) == sum(1 for i in range(n + 1) if is_prime(i))
+    assert prime_pi(10**6) == 78498
+    assert prime_pi(10**7) == 664579
+    assert _prime_pi_python(123456) == prime_pi(123456) == len(generate_primes(123456))
+
+    prime = generate_primes(7500)
+    for k in (1, 2, 5, 6, 25, 100, len(prime)):
+        assert nth_prime(k) == prime[k - 1]
+    assert nth_prime(10**4) == 104729
+    assert nth_prime(10**6) == 15485863
+
+
 def test_is_anagram():
     assert is_anagram("bored", "robed") == True
     assert is_anagram("dusty", "study") == True
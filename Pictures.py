@@ -55,33 +55,38 @@ def draw_checkerboard(size):
         print(row)
 
 
-active = True
-# List of commands
-valid_commands = ["help", "quit", "square", "box", "diagonaldown", "diagonalup", "checkerboard"]
-
-while active:
-    command = input("Enter a command: ").strip().lower()
-
-    if command == "help":
-        print_help()
-    elif command == "quit":
-        print("Goodbye!")
-        active = False
-    elif command == "square":
-        size = get_valid_size(1, 15)
-        draw_square(size)
-    elif command == "box":
-        size = get_valid_size(3, 15)
-        draw_box(size)
-    elif command == "diagonaldown":
-        size = get_valid_size(3, 15)
-        draw_diagonal_down(size)
-    elif command == "diagonalup":
-        size = get_valid_size(3, 15)
-        draw_diagonal_up(size)
-    elif command == "checkerboard":
-        size = get_valid_size(5, 15)
-        draw_checkerboard(size)
-
-    else:
-        print("Invalid command. Use: help, quit, square, box, diagonaldown, diagonalup, checkerboard")
\ No newline at end of file
+def main():
+    active = True
+    # List of commands
+    valid_commands = ["help", "quit", "square", "box", "diagonaldown", "diagonalup", "checkerboard"]
+
+    while active:
+        command = input("Enter a command: ").strip().lower()
+
+        if command == "help":
+            print_help()
+        elif command == "quit":
+            print("Goodbye!")
+            active = False
+        elif command == "square":
+            size = get_valid_size(1, 15)
+            draw_square(size)
+        elif command == "box":
+            size = get_valid_size(3, 15)
+            draw_box(size)
+        elif command == "diagonaldown":
+            size = get_valid_size(3, 15)
+            draw_diagonal_down(size)
+        elif command == "diagonalup":
+            size = get_valid_size(3, 15)
+            draw_diagonal_up(size)
+        elif command == "checkerboard":
+            size = get_valid_size(5, 15)
+            draw_checkerboard(size)
+
+        else:
+            print("Invalid command. Use: help, quit, square, box, diagonaldown, diagonalup, checkerboard")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+TAX_RATE = 0.04  # 4% tax
+
+
 def calculate_price(size, toppings, extra_sauce):
     size = size.lower()
 
@@ -24,38 +27,44 @@ def calculate_price(size, toppings, extra_sauce):
 
     return total_price
 
-# Initialize subtotal
-subtotal = 0
 
-num_pizzas = int(input("How many pizzas would you like? "))
+def main():
+    # Initialize subtotal
+    subtotal = 0
+
+    num_pizzas = int(input("How many pizzas would you like? "))
+
+    # Loop through the number of pizzas
+    for i in range(num_pizzas):  # Loop through each pizza
+        print(f"\nFor pizza {i + 1}:")
+
+        size = input("What size pizza would you like? (small, medium, large): ")
 
-# Loop through the number of pizzas
-for i in range(num_pizzas):  # Loop through each pizza
-    print(f"\nFor pizza {i + 1}:")
+        toppings = int(input("How many toppings would you like? "))
 
-    size = input("What size pizza would you like? (small, medium, large): ")
+        extra_sauce = input("Would you like extra sauce for $0.50? (y/n): ")
 
-    toppings = int(input("How many toppings would you like? "))
+        # Calculate price
+        pizza_price = calculate_price(size, toppings, extra_sauce)
 
-    extra_sauce = input("Would you like extra sauce for $0.50? (y/n): ")
+        if pizza_price > 0:  # Only if a positive number
+            # Print the details of the order
+            if extra_sauce == 'y':
+                print(f"A {size} pizza with {toppings} toppings and extra sauce is ${pizza_price:.2f}")
+            else:
+                print(f"A {size} pizza with {toppings} toppings is ${pizza_price:.2f}")
 
-    # Calculate price
-    pizza_price = calculate_price(size, toppings, extra_sauce)
+            subtotal += pizza_price  # Add to subtotal
 
-    if pizza_price > 0:  # Only if a positive number
-        # Print the details of the order
-        if extra_sauce == 'y':
-            print(f"A {size} pizza with {toppings} toppings and extra sauce is ${pizza_price:.2f}")
-        else:
-            print(f"A {size} pizza with {toppings} toppings is ${pizza_price:.2f}")
+    # Calculate tax and total
+    tax = subtotal * TAX_RATE  # 4% tax
+    total = subtotal + tax  # Total cost
 
-        subtotal += pizza_price  # Add to subtotal
+    # Print final costs
+    print(f"\nSubtotal: ${subtotal:.2f}")
+    print(f"Tax (4%): ${tax:.2f}")
+    print(f"Total: ${total:.2f}")
 
-# Calculate tax and total
-tax = subtotal * 0.04  # 4% tax
-total = subtotal + tax  # Total cost
 
-# Print final costs
-print(f"\nSubtotal: ${subtotal:.2f}")
-print(f"Tax (4%): ${tax:.2f}")
-print(f"Total: ${total:.2f}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import random
+import sys
 
 
 def single_trial(num_people):
@@ -28,41 +29,125 @@ def run_trials(num_people, num_trials):
     return successes  # Return the number of successful trials
 
 
-# Welcome message
-print("Welcome to the Shared Birthday Simulator")
-num_trials = 100000  # Setting the number of trials to conduct
+def first_collision(days=365):
+    # Add people one at a time until two of them share a birthday
+    taken = [False] * days
+    num_people = 0
 
-# Get threshold from the user
-valid_input = False
-while not valid_input:
-    threshold = input("What threshold would you like? (enter as a percent) ")
+    while True:
+        birthday = random.randrange(days)
+        num_people += 1
+        if taken[birthday]:
+            return num_people  # The smallest group size with a shared birthday
+        taken[birthday] = True
 
-    # Validate input
-    try:
-        threshold = int(threshold)
-        if 0 <= threshold <= 100:
-            valid_input = True  # Valid input, exit loop
-        else:
+
+def collision_histogram(num_trials, days=365):
+    # counts[n] is the number of trials whose first shared birthday came with person n
+    counts = [0] * (days + 2)  # The latest possible first collision is person days + 1
+
+    for _ in range(num_trials):
+        counts[first_collision(days)] += 1
+
+    return counts
+
+
+def cumulative_successes(counts):
+    # successes[n] is what run_trials(n, num_trials) counts: trials where a group
+    # of n people already has a shared birthday, i.e. first collision <= n
+    successes = []
+    running = 0
+    for count in counts:
+        running += count
+        successes.append(running)
+    return successes
+
+
+def probability_curve(counts):
+    # P(shared birthday | n people) for every n from one first-collision pass
+    num_trials = sum(counts)
+    return [successes / num_trials for successes in cumulative_successes(counts)]
+
+
+def people_needed(curve, threshold):
+    # Smallest group (of at least 2) whose probability meets the threshold percent
+    for num_people in range(2, len(curve)):
+        if curve[num_people] * 100 >= threshold:
+            return num_people
+    return None
+
+
+def export_curve(curve, file_path):
+    # Write the curve as CSV: number of people, probability of a shared birthday
+    with open(file_path, "w") as file:
+        file.write("people,probability\n")
+        for num_people in range(1, len(curve)):
+            file.write(f"{num_people},{curve[num_people]:.6f}\n")
+
+
+def get_threshold():
+    # Ask for a threshold percent; returns None when the user presses Enter
+    while True:
+        threshold = input("What threshold would you like? (enter as a percent, or press Enter to finish) ")
+        if not threshold.strip():
+            return None
+
+        # Validate input
+        try:
+            threshold = int(threshold)
+            if 0 <= threshold <= 100:
+                return threshold
             print("Error: Please enter a number between 0 and 100.")
-    except ValueError:
-        print("Error: Not a valid percent. Please enter a number.")
+        except ValueError:
+            print("Error: Not a valid percent. Please enter a number.")
+
+
+def main(export_path=None):
+    # Welcome message
+    print("Welcome to the Shared Birthday Simulator")
+    num_trials = 100000  # Setting the number of trials to conduct
+
+    # One pass records the first shared birthday of every trial, which
+    # answers every group size and every threshold below
+    counts = collision_histogram(num_trials)
+    successes = cumulative_successes(counts)
+    curve = probability_curve(counts)
+    if export_path:
+        export_curve(curve, export_path)
+        print(f"Probability curve written to {export_path}")
+
+    while True:
+        threshold = get_threshold()
+        if threshold is None:
+            break
+
+        needed = people_needed(curve, threshold)
+
+        # Print out the results for every group size up to the one needed
+        for num_people in range(2, (needed or len(curve) - 1) + 1):
+            success_count = successes[num_people]
+            probability = curve[num_people] * 100
+            print(
+                f"For {num_people} people, the probability of a shared birthday was {success_count} / {num_trials} or {probability:.2f}%")
+
+        if needed is not None:
+            print(f"To achieve at least {threshold}% probability of a collision, need {needed} people in the room.")
 
-num_people = 2 # Start with 2 people and keep increasing until threshold is met
+    print("Thank you for using the Shared Birthday Simulator!")
 
-while True:
-    # Run the trials for the current number of people
-    success_count = run_trials(num_people, num_trials)
-    probability = (success_count / num_trials) * 100  # Calculate probability
 
-    # Print out the results for this number of people
-    print(
-        f"For {num_people} people, the probability of a shared birthday was {success_count} / {num_trials} or {probability:.2f}%")
+def test_probability_curve():
+    counts = [0, 0, 1, 2, 1]  # First collisions with person 2, 3, 3 and 4
+    assert cumulative_successes(counts) == [0, 0, 1, 3, 4]
+    curve = probability_curve(counts)
+    assert curve == [0.0, 0.0, 0.25, 0.75, 1.0]
+    assert people_needed(curve, 0) == 2
+    assert people_needed(curve, 50) == 3
+    assert people_needed(curve, 100) == 4
 
-    # Check if the threshold is met
-    if probability >= threshold:
-        print(f"To achieve at least {threshold}% probability of a collision, need {num_people} people in the room.")
-        break  # Exit loop
+    assert first_collision(days=1) == 2  # With one possible birthday the second person always collides
+    assert collision_histogram(10, days=1) == [0, 0, 10]
 
-    num_people += 1  # Increment the number of people for the next trial
 
-print("Thank you for using the Shared Birthday Simulator!")
\ No newline at end of file
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
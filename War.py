@@ -4,16 +4,56 @@ suits = ['H', 'D', 'C', 'S']
 values = list(range(2, 15))  # 2-14 (Ace is 14. Range is 2 to 14)
 deck = [(value, suit) for value in values for suit in suits]
 
+
+class ShuffleSource:
+    # Seedable randomness for the simulator. Every deal is one shuffle of a
+    # copy of the deck, and two-card pools, the usual case, are ordered with
+    # one bit from a cached random word. Nothing is generated up front, so a
+    # fresh source per game costs no more than sharing one, and a seed
+    # replays the same games on every machine.
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+        self._bits = 0
+        self._bits_left = 0
+
+    def shuffled(self, deck):
+        # Return a shuffled copy of deck
+        cards = deck.copy()
+        self.random.shuffle(cards)
+        return cards
+
+    def coin(self):
+        # Return one random bit (0 or 1)
+        if not self._bits_left:
+            self._bits = self.random.getrandbits(64)
+            self._bits_left = 64
+        bit = self._bits & 1
+        self._bits >>= 1
+        self._bits_left -= 1
+        return bit
+
+    def shuffle(self, pool):
+        # Shuffle pool in place
+        if len(pool) == 2:
+            if self.coin():
+                pool.reverse()
+        else:
+            self.random.shuffle(pool)
+
+
 def shuffle_deck(deck):
     random.shuffle(deck)
     return deck
 
-def deal_cards(deck):
-    shuffled_deck = shuffle_deck(deck.copy())
+def deal_cards(deck, source=None):
+    if source is not None:
+        shuffled_deck = source.shuffled(deck)
+    else:
+        shuffled_deck = shuffle_deck(deck.copy())
     return shuffled_deck[:26], shuffled_deck[26:]
 
 
-def play_hand(player1_deck, player2_deck):
+def play_hand(player1_deck, player2_deck, source=None):
     winner = None
     common_pool = []
     while winner is None:
@@ -30,7 +70,10 @@ def play_hand(player1_deck, player2_deck):
             winner = 2
 
     # Shuffle common pool before awarding to winner
-    random.shuffle(common_pool)
+    if source is not None:
+        source.shuffle(common_pool)
+    else:
+        random.shuffle(common_pool)
 
     if winner == 1:
         player1_deck.extend(common_pool)
@@ -39,11 +82,12 @@ def play_hand(player1_deck, player2_deck):
 
     return winner
 
-def play_game():
-    player1_deck, player2_deck = deal_cards(deck)
+def play_game(source=None):
+    # With no source the global random module is used
+    player1_deck, player2_deck = deal_cards(deck, source)
     rounds = 0
     while player1_deck and player2_deck:
-        winner = play_hand(player1_deck, player2_deck)
+        winner = play_hand(player1_deck, player2_deck, source)
         if winner is None:
             return rounds, None  # Draw
         rounds += 1
@@ -52,14 +96,15 @@ def play_game():
     else:
         return rounds, 1  # Player 1 wins
 
-def run_simulations(num_games):
+def run_simulations(num_games, seed=None):
+    source = ShuffleSource(seed)  # The same seed replays the same games
     total_hands = 0
     player1_wins = 0
     player2_wins = 0
     draws = 0
 
     for _ in range(num_games):
-        hands, winner = play_game()
+        hands, winner = play_game(source)
         total_hands += hands
         if winner == 1:
             player1_wins += 1
@@ -80,6 +125,23 @@ def run_tests():
 
     # Check if the result (the winner) is correct
     assert result == 2, "Error: Player 2 should win!"
+
+    # Test the shuffle source: deals are permutations and seeds replay games
+    source = ShuffleSource(1)
+    for _ in range(10):
+        hand1, hand2 = deal_cards(deck, source)
+        assert len(hand1) == len(hand2) == 26, "Error: Each player should get 26 cards!"
+        assert sorted(hand1 + hand2) == sorted(deck), "Error: The deal should use the whole deck!"
+    assert run_simulations(20, seed=7) == run_simulations(20, seed=7), "Error: A seed should replay the games!"
+    assert deal_cards(deck, ShuffleSource(3)) == deal_cards(deck, ShuffleSource(3)), "Error: A seed should replay the deal!"
+
+    # Test two-card pools: both orders come up about equally often
+    pool_orders = {}
+    for _ in range(2000):
+        pool = [1, 2]
+        source.shuffle(pool)
+        pool_orders[tuple(pool)] = pool_orders.get(tuple(pool), 0) + 1
+    assert 900 < pool_orders[(1, 2)] < 1100, "Error: Two-card pools should be shuffled fairly!"
     print("All tests passed!")
 
 if __name__ == "__main__":
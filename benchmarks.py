@@ -0,0 +1,272 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import timeit
+
+import Functions_With_Testing as functions
+import More_Functions_with_Testing as more_functions
+import Shared_Birthdays as birthdays
+import War as war
+import cheating_hangman as hangman
+import word_store
+
+SEED = 2024  # Every workload is rebuilt from this seed so runs are comparable
+
+
+def make_words(count, length, rng):
+    """Build a set of `count` distinct random lowercase words of a given length."""
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    return words
+
+
+def bench_partition(size, rng):
+    words = make_words(size, 6, rng)
+    guessed = {"e", "a", "s"}
+    return lambda: hangman.partition(words, guessed)
+
+
+def bench_store_partition(size, rng):
+    store = word_store.WordStore(make_words(size, 6, rng), 6)
+    ids = store.all_ids()
+    guessed = {"e", "a", "s"}
+    return lambda: store.partition(ids, guessed)
+
+
+def bench_max_partition(size, rng):
+    partitions = hangman.partition(make_words(size, 6, rng), {"e", "a", "s"})
+    return lambda: hangman.max_partition(partitions)
+
+
+def bench_play_hand(size, rng):
+    # Pre-deal enough games up front so only the hands themselves are timed
+    deals = []
+    for _ in range(16):
+        cards = war.deck.copy()
+        rng.shuffle(cards)
+        deals.append((cards[:26], cards[26:]))
+
+    def run():
+        played = 0
+        while played < size:
+            for deck1, deck2 in deals:
+                player1_deck, player2_deck = deck1.copy(), deck2.copy()
+                while played < size and player1_deck and player2_deck:
+                    war.play_hand(player1_deck, player2_deck)
+                    played += 1
+    return run
+
+
+def bench_play_game(size, rng):
+    def run():
+        for _ in range(size):
+            war.play_game()
+    return run
+
+
+def bench_run_simulations(size, rng):
+    return lambda: war.run_simulations(size, seed=SEED)
+
+
+def bench_single_trial(size, rng):
+    return lambda: birthdays.single_trial(size)
+
+
+def bench_run_trials(size, rng):
+    return lambda: birthdays.run_trials(23, size)
+
+
+def bench_collision_histogram(size, rng):
+    return lambda: birthdays.collision_histogram(size)
+
+
+def bench_generate_primes(size, rng):
+    return lambda: more_functions.generate_primes(size)
+
+
+def bench_prime_pi(size, rng):
+    return lambda: more_functions.prime_pi(size)
+
+
+def bench_is_prime(size, rng):
+    def run():
+        for n in range(size):
+            more_functions.is_prime(n)
+    return run
+
+
+def bench_adds_to_target(size, rng):
+    # Distinct even numbers and an odd target: no pair exists, so the whole list is scanned
+    numbers = rng.sample(range(0, size * 20, 2), size)
+    return lambda: functions.adds_to_target(1, numbers)
+
+
+def bench_all_pairs(size, rng):
+    x = [rng.randrange(size) for _ in range(size)]
+    y = [rng.randrange(size) for _ in range(size)]
+    return lambda: functions.all_pairs(x, y)
+
+
+def bench_zigzag(size, rng):
+    s = "".join(rng.choices(string.ascii_letters, k=size))
+    return lambda: more_functions.zigzag(s, 5)
+
+
+# name -> (workload factory, input sizes)
+BENCHMARKS = {
+    "partition": (bench_partition, [1000, 10000, 50000]),
+    "store_partition": (bench_store_partition, [1000, 10000, 50000]),
+    "max_partition": (bench_max_partition, [1000, 10000, 50000]),
+    "play_hand": (bench_play_hand, [100, 1000]),
+    "play_game": (bench_play_game, [10, 100]),
+    "run_simulations": (bench_run_simulations, [10, 100]),
+    "single_trial": (bench_single_trial, [23, 60, 365]),
+    "run_trials": (bench_run_trials, [1000, 10000]),
+    "collision_histogram": (bench_collision_histogram, [1000, 10000]),
+    "generate_primes": (bench_generate_primes, [10000, 100000, 1000000]),
+    "prime_pi": (bench_prime_pi, [1000000, 100000000, 10000000000]),
+    "is_prime": (bench_is_prime, [1000, 10000, 100000]),
+    "adds_to_target": (bench_adds_to_target, [1000, 10000, 100000]),
+    "all_pairs": (bench_all_pairs, [10, 100, 300]),
+    "zigzag": (bench_zigzag, [100, 1000, 10000]),
+}
+
+
+def measure(func, repeat=5, min_time=0.05):
+    """
+    Time a zero-argument callable.
+
+    The loop count is grown until one repeat takes at least `min_time`
+    seconds, then the best and median per-call times over `repeat`
+    repeats are returned.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"min": min(times), "median": statistics.median(times), "number": number, "repeat": repeat}
+
+
+def run_benchmarks(selected=None, repeat=5, min_time=0.05, out=sys.stdout):
+    """Run every benchmark whose name contains one of `selected` and return the results."""
+    results = {}
+    for name, (factory, sizes) in BENCHMARKS.items():
+        if selected and not any(s in name for s in selected):
+            continue
+        for size in sizes:
+            key = f"{name}[n={size}]"
+            random.seed(SEED)  # play_game and the simulations use the global generator
+            func = factory(size, random.Random(SEED))
+            results[key] = measure(func, repeat, min_time)
+            print(f"{key:<32} {format_time(results[key]['min']):>12} (median {format_time(results[key]['median'])})",
+                  file=out)
+    return results
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Compare best-of-repeat times against a baseline.
+
+    Returns:
+    list of tuple: (name, baseline seconds, current seconds, ratio, status) where
+    status is "regression", "improvement" or "ok" using `threshold` as the
+    allowed relative slowdown or speedup.
+    """
+    rows = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["min"]
+        after = result["min"]
+        ratio = after / before if before else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+
+def load_baseline(file_path):
+    with open(file_path, "r") as file:
+        return json.load(file)["results"]
+
+
+def save_baseline(file_path, results):
+    data = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(file_path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hot functions across the repository.")
+    parser.add_argument("-k", dest="selected", action="append",
+                        help="Only run benchmarks whose name contains this text (repeatable).")
+    parser.add_argument("--save", metavar="FILE", help="Write the results to a JSON baseline.")
+    parser.add_argument("--compare", metavar="FILE", help="Compare the results against a JSON baseline.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown flagged as a regression (default: 0.10).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per repeat.")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        for name, (_, sizes) in BENCHMARKS.items():
+            print(f"{name}: sizes {sizes}")
+        return 0
+
+    results = run_benchmarks(args.selected, args.repeat, args.min_time)
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\nBaseline written to {args.save}")
+    if args.compare:
+        rows = compare_results(load_baseline(args.compare), results, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for name, before, after, ratio, status in rows:
+            print(f"{name:<32} {format_time(before):>12} -> {format_time(after):>12}  x{ratio:.2f}  {status}")
+        regressions = [row for row in rows if row[4] == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) found.")
+            return 1
+    return 0
+
+
+def test_compare_results():
+    baseline = {"a": {"min": 1.0}, "b": {"min": 1.0}, "c": {"min": 1.0}}
+    current = {"a": {"min": 1.5}, "b": {"min": 0.5}, "c": {"min": 1.05}, "d": {"min": 1.0}}
+    statuses = {row[0]: row[4] for row in compare_results(baseline, current, 0.10)}
+    assert statuses == {"a": "regression", "b": "improvement", "c": "ok"}
+
+
+if __name__ == "__main__":
+    sys.exit(main())
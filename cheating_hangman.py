@@ -1,8 +1,12 @@
+import math
 import random
-import unittest
-from collections import defaultdict
-from itertools import cycle
-from unittest.mock import patch
+import time
+from collections import OrderedDict, defaultdict
+
+import instrumentation
+from word_store import WordStore, read_word_store
+
+WORDS_PATH = "C:\\Users\\Dave Rowan\\Documents\\words.txt"
 
 
 def mask_word(word, guessed):
@@ -25,35 +29,174 @@ def partition(words, guessed):
     return partitions
 
 
+def revealed_count(hint):
+    """Returns the number of letters revealed in a hint."""
+    return len(hint) - hint.count("-")
+
+
 def max_partition(partitions):
     """Returns the hint for the largest partite set."""
     max_size = 0
-    best_hint = None
+    min_revealed = None
     tie_breaker = []
 
     for hint, part in partitions.items():
         size = len(part)
-        revealed = sum(1 for c in hint if c != "-")
+        if size < max_size:
+            continue
+        revealed = revealed_count(hint)  # Counted once per hint
 
-        if size > max_size or (
-            size == max_size
-            and (best_hint is None or revealed < sum(1 for c in best_hint if c != "-"))
-        ):
+        if size > max_size or min_revealed is None or revealed < min_revealed:
             max_size = size
-            best_hint = hint
+            min_revealed = revealed
             tie_breaker = [hint]
-        elif size == max_size and sum(1 for c in hint if c != "-") == sum(
-            1 for c in best_hint if c != "-"
-        ):
+        elif revealed == min_revealed:
             tie_breaker.append(hint)
 
     if len(tie_breaker) > 1:
-        best_hint = random.choice(tie_breaker)
+        return random.choice(tie_breaker)
+
+    return tie_breaker[0] if tie_breaker else None
+
+
+class LRUCache:
+    """A bounded mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize=100_000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+# Shared by every lookahead search, so states seen on earlier turns or in
+# earlier games in the same process are answered without searching again.
+lookahead_cache = LRUCache()
+
+LEAF_WEIGHT = 0.5  # Estimated misses the host can still force per halving of the candidate set
+
+
+class _OutOfTime(Exception):
+    """Raised inside the search when the per-turn time budget is spent."""
+
+
+class StringWords:
+    """
+    The `word_store.WordStore` interface for plain collections of strings.
+
+    Lets the lookahead search run on the sets returned by `partition` as
+    well as on the id arrays of a `WordStore`.
+    """
+
+    @staticmethod
+    def letters(words):
+        return set("".join(words))
+
+    @staticmethod
+    def partition(words, guessed):
+        """Like `partition`, but masks with one `str.translate` per word."""
+        table = str.maketrans({c: "-" for c in set("".join(words)) if c not in guessed})
+        families = defaultdict(list)
+        for word in words:
+            families[word.translate(table)].append(word)
+        return families
+
+    @staticmethod
+    def fingerprint(words):
+        return len(words), hash(frozenset(words))
+
+
+def _leaf_score(words):
+    return LEAF_WEIGHT * math.log2(len(words))
+
+
+def _state_score(words, guessed, depth, deadline, store):
+    """
+    Minimax score of a candidate set before the player's next guess.
+
+    The player picks the letter that minimizes the score and the host
+    answers with the family that maximizes it; a family that reveals
+    nothing costs the player one miss. Past `depth` guesses the remaining
+    set is scored by `_leaf_score`.
+    """
+    if depth == 0 or len(words) <= 1:
+        return _leaf_score(words)
+
+    chars = store.letters(words)
+    letters = {c for c in chars if c.isalpha()} - guessed
+    if not letters:
+        return _leaf_score(words)
+
+    # Guessed letters absent from every word do not change any hint
+    key = (store.fingerprint(words), frozenset(guessed & chars))
+    cached = lookahead_cache.get(key)
+    if cached is not None and cached[0] >= depth:
+        return cached[1]
+    if time.perf_counter() > deadline:
+        raise _OutOfTime
+
+    best = math.inf
+    for letter in letters:
+        next_guessed = guessed | {letter}
+        worst = max(
+            (letter not in hint) + _state_score(family, next_guessed, depth - 1, deadline, store)
+            for hint, family in store.partition(words, next_guessed).items()
+        )
+        best = min(best, worst)
+
+    lookahead_cache.put(key, (depth, best))
+    return best
+
+
+def lookahead_partition(partitions, guessed, guess, depth=2, budget=0.5, store=StringWords):
+    """
+    Returns the hint for the partite set that is best for the host looking
+    ahead up to `depth` guesses.
+
+    Deeper searches are tried one level at a time until `budget` seconds
+    have passed and the answer of the deepest finished search is used.
+    The first level only scores the partite sets themselves, so it always
+    finishes. Ties are broken like `max_partition`. Pass the `WordStore`
+    the partitions came from as `store` when they hold word ids.
+    """
+    deadline = time.perf_counter() + budget
+    best_hint = None
+
+    for level in range(1, depth + 1):
+        try:
+            scores = {
+                hint: (guess not in hint) + _state_score(part, guessed, level - 1, deadline, store)
+                for hint, part in partitions.items()
+            }
+        except _OutOfTime:
+            break
+
+        best_score = max(scores.values())
+        best = [hint for hint, score in scores.items() if score == best_score]
+        min_revealed = min(revealed_count(hint) for hint in best)
+        tie_breaker = [hint for hint in best if revealed_count(hint) == min_revealed]
+        best_hint = random.choice(tie_breaker) if len(tie_breaker) > 1 else tie_breaker[0]
 
     return best_hint
 
 
-def read_words(file_path="C:\\Users\\Dave Rowan\\Documents\\words.txt", length=None):
+def read_words(file_path=WORDS_PATH, length=None):
     """Read words from a file and filter by the specified length."""
     with open(file_path, "r") as file:
         if length:
@@ -61,8 +204,14 @@ def read_words(file_path="C:\\Users\\Dave Rowan\\Documents\\words.txt", length=N
         return {line.strip() for line in file}
 
 
-def play_game():
-    """Main game loop for playing Hangman."""
+def play_game(lookahead=0, budget=0.5):
+    """
+    Main game loop for playing Hangman.
+
+    With `lookahead` > 0 the host uses `lookahead_partition` to search that
+    many guesses ahead within `budget` seconds per turn instead of the
+    greedy `max_partition`.
+    """
     print("Starting the game...")
     try:
         word_length = int(input("What word length? "))
@@ -72,8 +221,10 @@ def play_game():
 
     word_length = abs(word_length) if word_length < 1 else word_length
 
-    # Read and filter words from the file
-    words = read_words(length=word_length)
+    # Read and filter words from the file into a compact store; the game
+    # works on arrays of word ids and only decodes words for display
+    store = read_word_store(WORDS_PATH, word_length)
+    words = store.all_ids()
     if not words:
         print("No words of the specified length found.")
         return
@@ -97,8 +248,13 @@ def play_game():
             continue
 
         guessed.add(guess)
-        partitions = partition(words, guessed)
-        chosen_hint = max_partition(partitions)
+        partitions = store.partition(words, guessed)
+        if lookahead:
+            chosen_hint = lookahead_partition(partitions, guessed, guess, lookahead, budget, store)
+        else:
+            chosen_hint = max_partition(partitions)
+        if instrumentation.enabled:
+            instrumentation.count("cheating_hangman.candidates_per_guess", len(partitions[chosen_hint]))
 
         # Assess if the guess was correct or not
         if hint == chosen_hint:
@@ -113,7 +269,7 @@ def play_game():
             return  # Exit the game after winning
 
     # Player has lost after max incorrect guesses
-    print(f"You lost. The correct word was '{random.choice(tuple(words))}'.")
+    print(f"You lost. The correct word was '{store.word(random.choice(words))}'.")
 
 
 def test_mask_word():
@@ -139,6 +295,11 @@ def test_partition():
 
 
 def test_max_partition():
+    # Imported here so that importing the game does not pay for unittest.mock
+    import unittest
+    from itertools import cycle
+    from unittest.mock import patch
+
     # Test case 1: Largest partition (by number of words)
     partitions = {"q---": {"quiz"}, "----": {"shiv", "wave"}, "-a-e": {"wave"}}
     try:
@@ -193,7 +354,48 @@ def test_max_partition():
         self.assertIn("You win! The word was 'abcd'.", output)
 
 
+def test_lookahead_partition():
+    # A miss now is worth more than a larger family one guess ahead...
+    words = {"ae", "be", "ce", "xy", "yx"}
+    partitions = partition(words, {"e"})
+    try:
+        assert (
+            lookahead_partition(partitions, {"e"}, "e", depth=1) == "--"
+        ), "Test failed: Lookahead depth 1"
+    except AssertionError as e:
+        print(e)
+
+    # ...but two guesses ahead the larger family forces more misses
+    lookahead_cache.clear()
+    try:
+        assert (
+            lookahead_partition(partitions, {"e"}, "e", depth=2) == "-e"
+        ), "Test failed: Lookahead depth 2"
+    except AssertionError as e:
+        print(e)
+
+    # Without any time budget only the first level finishes
+    lookahead_cache.clear()
+    try:
+        assert (
+            lookahead_partition(partitions, {"e"}, "e", depth=3, budget=-1) == "--"
+        ), "Test failed: Lookahead time budget"
+    except AssertionError as e:
+        print(e)
+
+    # The same search over the id arrays of a WordStore
+    store = WordStore(words, 2)
+    lookahead_cache.clear()
+    partitions = store.partition(store.all_ids(), {"e"})
+    try:
+        assert (
+            lookahead_partition(partitions, {"e"}, "e", depth=2, store=store) == "-e"
+        ), "Test failed: Lookahead over a WordStore"
+    except AssertionError as e:
+        print(e)
+
+
 if __name__ == "__main__":
     test_max_partition()
     test_mask_word()
-    play_game()
\ No newline at end of file
+    play_game()
@@ -0,0 +1,103 @@
+"""
+Importable core of the exercises, for batch jobs and worker processes.
+
+Nothing is imported up front: each name below is resolved on first use and
+loads only the module that defines it, so `import du2024` is instant and a
+worker that only needs `calculate_price` never loads the games, unittest or
+any optional backend such as NumPy. The interactive programs stay behind
+their `__main__` guards and are run with `python -m du2024 <program>`.
+
+Usage:
+    from du2024 import calculate_price, run_trials
+    from du2024 import hangman  # The cheating_hangman module itself
+"""
+import importlib
+
+# Module aliases -> module names
+_MODULES = {
+    "functions": "Functions_With_Testing",
+    "more_functions": "More_Functions_with_Testing",
+    "pictures": "Pictures",
+    "pizza": "Pizza_Ordering",
+    "pizza_service": "pizza_service",
+    "birthdays": "Shared_Birthdays",
+    "war": "War",
+    "hangman": "cheating_hangman",
+    "word_store": "word_store",
+    "instrumentation": "instrumentation",
+}
+
+# Re-exported names -> module alias (names shared by several modules, such
+# as `play_game`, are only available through the module aliases)
+_EXPORTS = {
+    "minmax": "functions",
+    "all_pairs": "functions",
+    "list_to_dict": "functions",
+    "invert_dict": "functions",
+    "adds_to_target": "functions",
+    "is_prime": "more_functions",
+    "generate_primes": "more_functions",
+    "prime_pi": "more_functions",
+    "nth_prime": "more_functions",
+    "is_anagram": "more_functions",
+    "is_anagram_set": "more_functions",
+    "is_palindrome": "more_functions",
+    "zigzag": "more_functions",
+    "draw_square": "pictures",
+    "draw_box": "pictures",
+    "draw_diagonal_down": "pictures",
+    "draw_diagonal_up": "pictures",
+    "draw_checkerboard": "pictures",
+    "calculate_price": "pizza",
+    "TAX_RATE": "pizza",
+    "price_order": "pizza_service",
+    "single_trial": "birthdays",
+    "run_trials": "birthdays",
+    "first_collision": "birthdays",
+    "collision_histogram": "birthdays",
+    "probability_curve": "birthdays",
+    "people_needed": "birthdays",
+    "export_curve": "birthdays",
+    "deal_cards": "war",
+    "play_hand": "war",
+    "run_simulations": "war",
+    "ShuffleSource": "war",
+    "mask_word": "hangman",
+    "partition": "hangman",
+    "max_partition": "hangman",
+    "lookahead_partition": "hangman",
+    "WordStore": "word_store",
+    "read_word_store": "word_store",
+}
+
+__all__ = sorted(_MODULES) + sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = importlib.import_module(_MODULES[name])
+    elif name in _EXPORTS:
+        value = getattr(__getattr__(_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def test_lazy_imports():
+    import subprocess
+    import sys
+
+    # A fresh interpreter, so modules imported by other tests do not count
+    code = (
+        "import sys, du2024\n"
+        "assert not set(du2024._MODULES.values()) & set(sys.modules)\n"
+        "assert du2024.calculate_price('m', 2, 'y') == 13.25\n"
+        "assert 'Pizza_Ordering' in sys.modules and 'War' not in sys.modules\n"
+        "assert 'unittest' not in sys.modules and 'numpy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
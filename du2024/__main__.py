@@ -0,0 +1,29 @@
+import runpy
+import sys
+
+# Program name -> module run as __main__
+PROGRAMS = {
+    "pictures": "Pictures",
+    "pizza": "Pizza_Ordering",
+    "pizza-service": "pizza_service",
+    "pizza-load": "pizza_load",
+    "birthdays": "Shared_Birthdays",
+    "war": "War",
+    "hangman": "cheating_hangman",
+    "benchmarks": "benchmarks",
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in PROGRAMS:
+        print(f"Usage: python -m du2024 {{{','.join(PROGRAMS)}}} [args...]")
+        return 2
+    # The program sees its own name and arguments, as if run directly
+    sys.argv = [PROGRAMS[argv[0]] + ".py"] + argv[1:]
+    runpy.run_module(PROGRAMS[argv[0]], run_name="__main__", alter_sys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Opt-in call statistics for the hot functions of the games.
+
+Nothing is wrapped until `enable()` is called: it swaps the functions and
+methods listed in `TARGETS` for timing wrappers, and `disable()` puts the
+originals back, so the disabled cost is exactly zero. Callers inside those
+modules look the functions up as globals, which means e.g. the `mask_word`
+calls made by `partition` are counted as well. Per-turn counters recorded
+from inside the games check the `enabled` flag first, which is all they
+cost while instrumentation is off.
+
+Usage:
+    import instrumentation
+    instrumentation.enable()
+    ...  # play some games
+    print(instrumentation.snapshot())
+    instrumentation.disable()
+"""
+import importlib
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+
+# module name -> functions (or "Class.method") to time
+TARGETS = {
+    "cheating_hangman": ["mask_word", "partition", "max_partition"],
+    "word_store": ["WordStore.partition"],
+    "War": ["play_hand"],
+    "Shared_Birthdays": ["single_trial", "first_collision", "collision_histogram"],
+    "More_Functions_with_Testing": ["generate_primes"],
+}
+
+# Upper bounds of the latency buckets in nanoseconds (1us .. 1s, plus overflow)
+LATENCY_BOUNDS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000)
+# Upper bounds of the buckets used by the per-turn counters
+COUNT_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536)
+
+
+class Histogram:
+    """Counts of values falling into buckets with the given inclusive upper bounds."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.n = 0
+
+    def record(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.n += 1
+
+    def to_dict(self, label=str):
+        buckets = {f"<={label(bound)}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets[f">{label(self.bounds[-1])}"] = self.counts[-1]
+        return {"count": self.n, "mean": self.total / self.n if self.n else 0.0, "buckets": buckets}
+
+
+class FunctionStats:
+    """Call count, cumulative time and latency histogram for one function."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.latency = Histogram(LATENCY_BOUNDS)
+
+    def clear(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.latency = Histogram(LATENCY_BOUNDS)
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.latency.record(elapsed_ns)
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total_s": self.total_ns / 1e9,
+            "mean_s": self.total_ns / self.calls / 1e9 if self.calls else 0.0,
+            "latency": self.latency.to_dict(_format_ns)["buckets"],
+        }
+
+
+enabled = False  # Checked by the games before recording a per-turn counter
+
+_functions = {}  # "module.function" -> FunctionStats
+_counters = {}  # counter name -> Histogram
+_originals = {}  # (module or class, function name) -> unwrapped function
+
+
+def _format_ns(ns):
+    for unit, scale in (("s", 1_000_000_000), ("ms", 1_000_000), ("us", 1_000)):
+        if ns >= scale:
+            return f"{ns // scale}{unit}"
+    return f"{ns}ns"
+
+
+def count(name, value):
+    """Record one observation of a per-turn counter such as a candidate-set size."""
+    histogram = _counters.get(name)
+    if histogram is None:
+        histogram = _counters[name] = Histogram(COUNT_BOUNDS)
+    histogram.record(value)
+
+
+def _timed(name, func):
+    stats = _functions.setdefault(name, FunctionStats())
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.record(perf_counter_ns() - start)
+    return wrapper
+
+
+def _timed_play_hand(name, func):
+    timed = _timed(name, func)
+
+    @wraps(func)
+    def wrapper(player1_deck, player2_deck, *args, **kwargs):
+        before1, before2 = len(player1_deck), len(player2_deck)
+        winner = timed(player1_deck, player2_deck, *args, **kwargs)
+        # The winner gains k cards and the loser loses k, so the pool held 2k cards
+        count("War.cards_per_hand",
+              abs(len(player1_deck) - before1) + abs(len(player2_deck) - before2))
+        return winner
+    return wrapper
+
+
+# Functions that also feed a per-turn counter
+_WRAPPERS = {
+    "War.play_hand": _timed_play_hand,
+}
+
+
+def enable(targets=None):
+    """Wrap the target functions (default: `TARGETS`) with timing hooks."""
+    global enabled
+    enabled = True
+    for module_name, names in (targets or TARGETS).items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            owner = module
+            *path, attr = name.split(".")
+            for part in path:
+                owner = getattr(owner, part)
+            key = (owner, attr)
+            if key in _originals:
+                continue
+            func = getattr(owner, attr)
+            qualified = f"{module_name}.{name}"
+            _originals[key] = func
+            setattr(owner, attr, _WRAPPERS.get(qualified, _timed)(qualified, func))
+
+
+def disable():
+    """Restore the original, unwrapped functions."""
+    global enabled
+    enabled = False
+    for (owner, name), func in _originals.items():
+        setattr(owner, name, func)
+    _originals.clear()
+
+
+def is_enabled():
+    return enabled
+
+
+def reset():
+    """Forget every statistic recorded so far."""
+    # Cleared in place: the installed wrappers keep references to these objects
+    for stats in _functions.values():
+        stats.clear()
+    _counters.clear()
+
+
+@contextmanager
+def instrumented(targets=None):
+    """Enable instrumentation for the duration of a `with` block."""
+    enable(targets)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot():
+    """Return the statistics recorded so far as plain, JSON-serializable data."""
+    return {
+        "functions": {name: stats.to_dict() for name, stats in _functions.items()},
+        "counters": {name: histogram.to_dict() for name, histogram in _counters.items()},
+    }
+
+
+def dump(file):
+    """Write `snapshot()` as JSON to an open text file."""
+    import json  # Only needed here; keeps importing the games cheap
+
+    json.dump(snapshot(), file, indent=2, sort_keys=True)
+
+
+def test_instrumentation():
+    import os
+    import tempfile
+    from itertools import cycle
+    from unittest.mock import patch
+
+    import Shared_Birthdays
+    import War
+    import cheating_hangman
+
+    original = cheating_hangman.mask_word
+    reset()
+    with instrumented():
+        assert is_enabled()
+        partitions = cheating_hangman.partition({"quiz", "shiv", "wave"}, {"q"})
+        cheating_hangman.max_partition(partitions)
+        War.play_hand([(2, "H"), (5, "S")], [(2, "D"), (3, "C")])
+        Shared_Birthdays.collision_histogram(10)
+    assert not is_enabled()
+    assert cheating_hangman.mask_word is original
+
+    stats = snapshot()
+    assert stats["functions"]["cheating_hangman.mask_word"]["calls"] == 3
+    assert stats["functions"]["cheating_hangman.partition"]["calls"] == 1
+    assert stats["functions"]["War.play_hand"]["calls"] == 1
+    assert stats["counters"]["War.cards_per_hand"]["mean"] == 4
+    # The birthday simulator's hot path is first_collision, called once per trial
+    assert stats["functions"]["Shared_Birthdays.collision_histogram"]["calls"] == 1
+    assert stats["functions"]["Shared_Birthdays.first_collision"]["calls"] == 10
+    # Only turns of play_game feed the candidate-set counter
+    assert "cheating_hangman.candidates_per_guess" not in stats["counters"]
+
+    # Statistics keep being recorded after a reset while still enabled
+    with instrumented():
+        cheating_hangman.partition({"quiz"}, {"q"})
+        reset()
+        cheating_hangman.partition({"quiz"}, {"q"})
+        assert snapshot()["functions"]["cheating_hangman.partition"]["calls"] == 1
+
+    # One candidate-set size per guess, also with the lookahead host
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as words:
+        words.write("abcd\nbcde\ncdef\nquiz\nshiv\nwave\n")
+    try:
+        for lookahead in (0, 2):
+            reset()
+            with instrumented(), patch.object(cheating_hangman, "WORDS_PATH", words.name), \
+                    patch("builtins.input", side_effect=cycle(["4", "x", "y", "z", "q", "e"])), \
+                    patch("builtins.print"):
+                cheating_hangman.play_game(lookahead=lookahead)
+            assert snapshot()["counters"]["cheating_hangman.candidates_per_guess"]["count"] == 5
+    finally:
+        os.remove(words.name)
+    reset()
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+SIZES = ["small", "medium", "large"]
+
+
+def random_order(order_id, rng):
+    """Build a random order with one to four pizzas."""
+    pizzas = [
+        {
+            "size": rng.choice(SIZES),
+            "toppings": rng.randint(0, 5),
+            "extra_sauce": rng.choice("yn"),
+        }
+        for _ in range(rng.randint(1, 4))
+    ]
+    return {"id": order_id, "pizzas": pizzas}
+
+
+def percentile(sorted_values, pct):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def client(host, port, client_id, num_orders, latencies, seed):
+    """Send `num_orders` orders one at a time and record each round trip."""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(num_orders):
+            line = json.dumps(random_order(f"{client_id}-{i}", rng)) + "\n"
+            start = time.perf_counter()
+            writer.write(line.encode())
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not reply:
+                raise ConnectionError("Service closed the connection.")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(host, port, connections, orders, seed=None):
+    """
+    Drive the order service with concurrent clients.
+
+    Returns:
+    tuple: (orders per second, p50 latency, p99 latency), latencies in seconds.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, c, orders, latencies, None if seed is None else seed + c)
+        for c in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return len(latencies) / elapsed, percentile(latencies, 50), percentile(latencies, 99)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for pizza_service.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--connections", type=int, default=50, help="Concurrent clients.")
+    parser.add_argument("--orders", type=int, default=200, help="Orders sent by each client.")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 99) == 0.0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rate, p50, p99 = asyncio.run(run_load(args.host, args.port, args.connections, args.orders, args.seed))
+    print(f"Orders: {args.connections * args.orders}")
+    print(f"Throughput: {rate:.0f} orders/s")
+    print(f"Latency p50: {p50 * 1000:.2f} ms")
+    print(f"Latency p99: {p99 * 1000:.2f} ms")
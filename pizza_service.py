@@ -0,0 +1,379 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import stat
+import sys
+import time
+
+from Pizza_Ordering import TAX_RATE, calculate_price
+
+VALID_SIZES = {"small", "s", "medium", "m", "large", "l"}
+VALID_SAUCE = {"y", "n"}
+MAX_TOPPINGS = 10  # Per pizza; anything above is rejected as a bad quantity
+
+
+class OrderError(ValueError):
+    """Raised when an order does not pass validation."""
+
+
+def validate_pizza(pizza):
+    """
+    Check a single pizza from an order and return its normalized fields.
+
+    Parameters:
+    pizza (dict): A mapping with "size", "toppings" and optional "extra_sauce".
+
+    Returns:
+    tuple: (size, toppings, extra_sauce) ready for `calculate_price`.
+    """
+    if not isinstance(pizza, dict):
+        raise OrderError("Each pizza must be an object.")
+
+    size = pizza.get("size")
+    if not isinstance(size, str) or size.lower() not in VALID_SIZES:
+        raise OrderError(f"Invalid size: {size!r}.")
+
+    toppings = pizza.get("toppings", 0)
+    if isinstance(toppings, bool) or not isinstance(toppings, int) or not 0 <= toppings <= MAX_TOPPINGS:
+        raise OrderError(f"Invalid number of toppings: {toppings!r}.")
+
+    extra_sauce = pizza.get("extra_sauce", "n")
+    if not isinstance(extra_sauce, str) or extra_sauce.lower() not in VALID_SAUCE:
+        raise OrderError(f"Invalid extra sauce answer: {extra_sauce!r}.")
+
+    return size.lower(), toppings, extra_sauce.lower()
+
+
+def price_order(order):
+    """
+    Validate an order and price every pizza in it with `calculate_price`.
+
+    Parameters:
+    order (dict): A mapping with a non-empty "pizzas" list.
+
+    Returns:
+    dict: The subtotal, 4% tax and total for the order, rounded to cents.
+    """
+    if not isinstance(order, dict):
+        raise OrderError("Order must be an object.")
+    pizzas = order.get("pizzas")
+    if not isinstance(pizzas, list) or not pizzas:
+        raise OrderError("Order must contain at least one pizza.")
+
+    subtotal = 0
+    for pizza in pizzas:
+        subtotal += calculate_price(*validate_pizza(pizza))
+
+    tax = subtotal * TAX_RATE
+    return {
+        "subtotal": round(subtotal, 2),
+        "tax": round(tax, 2),
+        "total": round(subtotal + tax, 2),
+    }
+
+
+def handle_line(line):
+    """Price one JSON-encoded order line and return the JSON reply line."""
+    order_id = None
+    try:
+        order = json.loads(line)
+        if isinstance(order, dict):
+            order_id = order.get("id")
+        reply = price_order(order)
+    except json.JSONDecodeError:
+        reply = {"error": "Order is not valid JSON."}
+    except OrderError as e:
+        reply = {"error": str(e)}
+    except UnicodeDecodeError:
+        reply = {"error": "Order is not valid UTF-8."}
+    except (ValueError, RecursionError, OverflowError):
+        # e.g. JSON nested too deeply or numbers too large to price
+        reply = {"error": "Order could not be processed."}
+    reply["id"] = order_id
+    return json.dumps(reply) + "\n"
+
+
+class OrderLog:
+    """
+    Buffer log lines in memory and write them out in batches.
+
+    A batch is written when `batch_size` lines are waiting or when the
+    background flusher wakes up every `flush_interval` seconds, whichever
+    comes first, so a busy service does one write per batch instead of
+    one per order.
+    """
+
+    def __init__(self, file, batch_size=256, flush_interval=0.5):
+        self.file = file
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._task = None
+
+    def write(self, line):
+        self._pending.append(line)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.file.write("".join(self._pending))
+            self.file.flush()
+            self._pending.clear()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+
+
+TOO_LONG_REPLY = json.dumps({"error": "Order line is too long.", "id": None}) + "\n"
+
+
+class StreamLineReader:
+    """Read order lines from an asyncio.StreamReader, skipping overlong ones."""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    async def read_line(self):
+        """
+        Return the next line, b"" at the end of the stream, or None for a
+        line longer than the reader's limit (which is skipped entirely).
+        """
+        try:
+            return await self.reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            return e.partial  # The last line may lack a newline
+        except asyncio.LimitOverrunError as e:
+            await self.reader.readexactly(e.consumed)
+
+        # Drop the rest of the overlong line, up to and including its newline
+        while True:
+            try:
+                await self.reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                await self.reader.readexactly(e.consumed)
+
+
+class FileLineReader:
+    """
+    Read order lines from a blocking binary file, such as stdin redirected
+    from a regular file, in a worker thread so the event loop is not blocked.
+    """
+
+    def __init__(self, file, limit=2 ** 16):
+        self.file = file
+        self.limit = limit
+
+    async def _readline(self, size):
+        return await asyncio.get_running_loop().run_in_executor(None, self.file.readline, size)
+
+    async def read_line(self):
+        """Same contract as `StreamLineReader.read_line`."""
+        line = await self._readline(self.limit + 1)
+        if len(line) <= self.limit:
+            return line
+        while line and not line.endswith(b"\n"):
+            line = await self._readline(self.limit)
+        return None
+
+
+async def serve_stream(reader, writer, log):
+    """Answer every order line from `reader` until the stream closes."""
+    while True:
+        line = await reader.read_line()
+        if line is None:
+            writer.write(TOO_LONG_REPLY.encode())
+            log.write(f"{time.time():.6f} 0.0us {TOO_LONG_REPLY}")
+            await writer.drain()
+            continue
+        if not line:
+            break
+        if not line.strip():
+            continue
+        start = time.perf_counter()
+        reply = handle_line(line)
+        writer.write(reply.encode())
+        log.write(f"{time.time():.6f} {(time.perf_counter() - start) * 1e6:.1f}us {reply}")
+        await writer.drain()
+
+
+async def run_server(host, port, log):
+    """Accept concurrent order connections on a local TCP socket."""
+
+    async def on_connect(reader, writer):
+        try:
+            await serve_stream(StreamLineReader(reader), writer, log)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(on_connect, host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Pizza order service listening on {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+class _StdoutWriter:
+    """Minimal stand-in for asyncio.StreamWriter backed by sys.stdout."""
+
+    def write(self, data):
+        sys.stdout.buffer.write(data)
+
+    async def drain(self):
+        sys.stdout.buffer.flush()
+
+
+async def run_stdin(log):
+    """Answer order lines read from stdin, one reply line each on stdout."""
+    mode = os.fstat(sys.stdin.fileno()).st_mode
+    if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode):
+        loop = asyncio.get_running_loop()
+        stream = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stream), sys.stdin)
+        reader = StreamLineReader(stream)
+    else:
+        # Pipe transports cannot read regular files, e.g. `--stdin < orders.jsonl`
+        reader = FileLineReader(sys.stdin.buffer)
+    await serve_stream(reader, _StdoutWriter(), log)
+
+
+async def main(args):
+    log_file = open(args.log, "a") if args.log else sys.stderr
+    log = OrderLog(log_file, batch_size=args.log_batch, flush_interval=args.log_interval)
+    log.start()
+    try:
+        # Stop cleanly on SIGTERM so the last log batch is not lost
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass  # Signal handlers are not available on Windows event loops
+    try:
+        if args.stdin:
+            await run_stdin(log)
+        else:
+            await run_server(args.host, args.port, log)
+    finally:
+        await log.close()
+        if log_file is not sys.stderr:
+            log_file.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent pizza order-intake service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stdin", action="store_true", help="Read orders from stdin instead of a socket.")
+    parser.add_argument("--log", help="Append the order log to this file (default: stderr).")
+    parser.add_argument("--log-batch", type=int, default=256, help="Log lines per write.")
+    parser.add_argument("--log-interval", type=float, default=0.5, help="Seconds between log flushes.")
+    return parser.parse_args(argv)
+
+
+def test_price_order():
+    order = {"pizzas": [{"size": "m", "toppings": 2, "extra_sauce": "y"}, {"size": "Small", "toppings": 0}]}
+    assert price_order(order) == {"subtotal": 20.25, "tax": 0.81, "total": 21.06}
+
+    for bad in ({}, {"pizzas": []}, {"pizzas": [{"size": "huge"}]},
+                {"pizzas": [{"size": "l", "toppings": -1}]},
+                {"pizzas": [{"size": "l", "toppings": MAX_TOPPINGS + 1}]},
+                {"pizzas": [{"size": "l", "toppings": 10 ** 44}]},
+                {"pizzas": [{"size": "l", "extra_sauce": "maybe"}]}):
+        try:
+            price_order(bad)
+        except OrderError:
+            pass
+        else:
+            assert False, f"Order {bad} should have been rejected"
+
+    assert json.loads(handle_line('{"id": 7, "pizzas": [{"size": "l", "toppings": 1}]}')) == {
+        "subtotal": 16.25, "tax": 0.65, "total": 16.9, "id": 7}
+    assert json.loads(handle_line("not json")) == {"error": "Order is not valid JSON.", "id": None}
+
+
+class _ListWriter:
+    """Collects the bytes written by `serve_stream` in tests."""
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def test_serve_stream():
+    import io
+    import subprocess
+    import tempfile
+
+    good = b'{"id": 1, "pizzas": [{"size": "s"}]}\n'
+    lines = [
+        good,
+        b"\xff\n",  # Not UTF-8
+        b"[" * 100000 + b"\n",  # Nested too deeply (and longer than the limit below)
+        b"[" * 5000 + b"\n",  # Nested too deeply
+        b"x" * 7000 + b"\n",  # Too long
+        good.rstrip(b"\n"),  # Last line without a newline
+    ]
+    expected = [
+        {"subtotal": 7.0, "tax": 0.28, "total": 7.28, "id": 1},
+        {"error": "Order is not valid UTF-8.", "id": None},
+        {"error": "Order line is too long.", "id": None},
+        {"error": "Order could not be processed.", "id": None},
+        {"error": "Order line is too long.", "id": None},
+        {"subtotal": 7.0, "tax": 0.28, "total": 7.28, "id": 1},
+    ]
+    data = b"".join(lines)
+
+    async def serve(reader):
+        writer = _ListWriter()
+        log = OrderLog(io.StringIO())
+        await serve_stream(reader, writer, log)
+        return [json.loads(line) for line in writer.data.splitlines()]
+
+    async def serve_from_stream_reader():
+        stream = asyncio.StreamReader(limit=6000)
+        stream.feed_data(data)
+        stream.feed_eof()
+        return await serve(StreamLineReader(stream))
+
+    assert asyncio.run(serve_from_stream_reader()) == expected
+    assert asyncio.run(serve(FileLineReader(io.BytesIO(data), limit=6000))) == expected
+
+    # stdin redirected from a regular file, which pipe transports cannot read
+    with tempfile.TemporaryFile() as orders:
+        orders.write(good + b"\xff\n" + good)
+        orders.seek(0)
+        result = subprocess.run([sys.executable, __file__, "--stdin", "--log", os.devnull],
+                                stdin=orders, capture_output=True, check=True)
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [expected[0], expected[1], expected[0]]
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(parse_args()))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
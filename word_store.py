@@ -0,0 +1,123 @@
+from array import array
+from collections import defaultdict
+
+ENCODING = "latin-1"  # One byte per character keeps every row the same width
+_DASHES = b"-" * 256  # Translation table that masks every byte
+
+
+class WordStore:
+    """
+    Words of a single length packed as fixed-width byte rows in one buffer.
+
+    A word is identified by its row number, and groups of words (such as the
+    families built by `partition`) are `array('I')` objects of row numbers, so
+    a family costs 4 bytes per word instead of a set slot plus a `str`
+    object. Words are only decoded back to strings by `word` and `words`.
+    """
+
+    def __init__(self, words, length):
+        rows = sorted({word.encode(ENCODING) for word in words})
+        if any(len(row) != length for row in rows):
+            raise ValueError(f"Every word must be {length} characters long.")
+        self.length = length
+        self.count = len(rows)
+        self.rows = b"".join(rows)
+        self.key = hash(self.rows)  # Identifies the contents in memo keys
+
+    def __len__(self):
+        return self.count
+
+    def all_ids(self):
+        """Returns the ids of every word in the store."""
+        return array("I", range(self.count))
+
+    def word(self, word_id):
+        """Returns the word with the given id as a string."""
+        start = word_id * self.length
+        return self.rows[start:start + self.length].decode(ENCODING)
+
+    def words(self, ids):
+        """Returns the words with the given ids as a set of strings."""
+        return {self.word(word_id) for word_id in ids}
+
+    def letters(self, ids):
+        """Returns the set of characters used by the words with the given ids."""
+        if len(ids) == self.count:
+            return set(self.rows.decode(ENCODING))
+        rows, length = self.rows, self.length
+        return set(b"".join(rows[i * length:(i + 1) * length] for i in ids).decode(ENCODING))
+
+    def partition(self, ids, guessed):
+        """
+        Generates the partitions of the words with the given ids based upon
+        guessed letters.
+
+        Same result as `cheating_hangman.partition`, with each partite set
+        given as an array of ids in increasing order. Rows are masked with
+        `bytes.translate`: in one pass over the whole buffer when most of
+        the store is selected, otherwise row by row.
+        """
+        table = bytearray(_DASHES)
+        for c in guessed:
+            if ord(c) < 256:  # Latin-1 byte value
+                table[ord(c)] = ord(c)
+
+        rows, length = self.rows, self.length
+        groups = defaultdict(lambda: array("I"))
+        if len(ids) * 4 >= self.count:
+            masked = rows.translate(table)
+            for i in ids:
+                start = i * length
+                groups[masked[start:start + length]].append(i)
+        else:
+            for i in ids:
+                start = i * length
+                groups[rows[start:start + length].translate(table)].append(i)
+        return {hint.decode(ENCODING): group for hint, group in groups.items()}
+
+    def fingerprint(self, ids):
+        """Returns a hashable key identifying a set of ids in this store."""
+        return self.key, len(ids), hash(ids.tobytes())
+
+    def nbytes(self):
+        """Returns the size of the packed word buffer in bytes."""
+        return len(self.rows)
+
+
+def read_word_store(file_path, length):
+    """Read the words of the specified length from a file into a `WordStore`."""
+    with open(file_path, "r") as file:
+        words = []
+        for line in file:
+            word = line.strip()
+            if len(word) == length:
+                try:
+                    word.encode(ENCODING)
+                except UnicodeEncodeError:
+                    continue  # Cannot be stored in a one-byte-per-character row
+                words.append(word)
+    return WordStore(words, length)
+
+
+def test_word_store():
+    store = WordStore(["wave", "quiz", "shiv", "quiz"], 4)
+    assert len(store) == 3
+    assert store.words(store.all_ids()) == {"quiz", "shiv", "wave"}
+
+    partitions = store.partition(store.all_ids(), {"q"})
+    assert {hint: store.words(ids) for hint, ids in partitions.items()} == {
+        "q---": {"quiz"}, "----": {"shiv", "wave"}}
+
+    family = partitions["----"]
+    assert store.letters(family) == set("shivwave")
+    partitions = store.partition(family, {"q", "a"})
+    assert {hint: store.words(ids) for hint, ids in partitions.items()} == {
+        "----": {"shiv"}, "-a--": {"wave"}}
+    assert store.fingerprint(family) == store.fingerprint(array("I", family))
+
+    # A small family is masked row by row, with the same result
+    store = WordStore([f"{a}{b}" for a in "abcdefgh" for b in "abcdefgh"], 2)
+    family = array("I", [0, 9, 18])  # "aa", "bb", "cc"
+    partitions = store.partition(family, {"b"})
+    assert {hint: store.words(ids) for hint, ids in partitions.items()} == {
+        "--": {"aa", "cc"}, "bb": {"bb"}}